@@ -1,13 +1,28 @@
 from flask import (
     Flask, render_template, request, redirect,
-    url_for, session, flash
+    url_for, session, flash, g, abort, stream_template
 )
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import delete, event, func, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.pool import QueuePool
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from datetime import datetime
-import random
+import hmac
+import json
+import os
+import secrets
+import sqlite3
 import string
 
+import redis
+
 # ------------------------------------------------
 # FLASK APP & DATABASE CONFIG
 # ------------------------------------------------
@@ -16,14 +31,83 @@ app = Flask(__name__)
 app.config["SECRET_KEY"] = "super-secret-hackathon-key"
 app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///hackathon.db"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# Reuse long-lived SQLite connections across requests (warm page cache,
+# no reconnect per request) regardless of the SQLAlchemy version's default.
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "poolclass": QueuePool,
+    "pool_size": 5,
+    "max_overflow": 10,
+    "connect_args": {"check_same_thread": False},
+}
 
 db = SQLAlchemy(app)
 
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    Tune every new SQLite connection: WAL lets readers run alongside
+    writers, NORMAL sync skips an fsync per commit, and mmap + a 64 MB
+    page cache keep hot pages in memory.
+    """
+    if not isinstance(dbapi_conn, sqlite3.Connection):
+        return
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")
+    cur.execute("PRAGMA cache_size=-64000")
+    cur.close()
+
+# ------------------------------------------------
+# REDIS CACHE (for hot, rarely-changing reads)
+# ------------------------------------------------
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+# Short timeouts so an unreachable Redis host falls back to the DB quickly
+# instead of hanging each request until the OS TCP timeout
+rc = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=0.2, socket_timeout=0.2)
+
+# Whole-page cache for pages that look the same for every visitor.
+# Uses Redis only when REDIS_URL is set; otherwise an in-process cache, so
+# local runs (debug mode re-raises cache errors) don't need a Redis server.
+cache = Cache(app, config={
+    "CACHE_TYPE": os.environ.get(
+        "CACHE_TYPE", "RedisCache" if "REDIS_URL" in os.environ else "SimpleCache"
+    ),
+    "CACHE_REDIS_URL": REDIS_URL,
+})
+
+STATS_TTL = 60  # home page (and the counts on it)
+UPDATES_TTL = 30  # live updates / notifications
+SPONSORS_TTL = 6 * 3600  # sponsors hardly ever change
+
+# ------------------------------------------------
+# APP SETTINGS
+# ------------------------------------------------
+INVITE_ALPHABET = string.ascii_uppercase + string.digits
+INVITE_CODE_LENGTH = 6
+INVITE_CODE_SPACE = len(INVITE_ALPHABET) ** INVITE_CODE_LENGTH
+
+LEADERBOARD_PER_PAGE = 50
+ADMIN_STREAM_BATCH = 100  # rows fetched per batch when streaming admin lists
+
+# ------------------------------------------------
+# PASSWORD HASHING (Argon2id)
+# ------------------------------------------------
+ph = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Admin credentials come from the environment; ADMIN_PWHASH is an Argon2id
+# hash (e.g. from PasswordHasher().hash(...)). Defaults are for local dev.
+ADMIN_EMAIL = os.environ.get("ADMIN_EMAIL", "admin@hackathon.com")
+ADMIN_PASSWORD_HASH = os.environ.get("ADMIN_PWHASH") or ph.hash("admin123")
+
 # ------------------------------------------------
 # HACKATHON END TIME (for countdown)
 # ------------------------------------------------
 # TODO: change this to your real hackathon end date/time
 HACKATHON_END = datetime(2025, 1, 19, 9, 0, 0)  # year, month, day, hour, minute
+HACKATHON_END_ISO = HACKATHON_END.isoformat()  # computed once, not per render
 
 
 @app.context_processor
@@ -32,7 +116,7 @@ def inject_hackathon_time():
     This makes {{ hackathon_end_iso }} available
     in ALL templates (index, dashboard, etc.).
     """
-    return {"hackathon_end_iso": HACKATHON_END.isoformat()}
+    return {"hackathon_end_iso": HACKATHON_END_ISO}
 
 
 # ------------------------------------------------
@@ -61,7 +145,7 @@ class User(db.Model):
     college = db.Column(db.String(120), nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
 
-    team_id = db.Column(db.Integer, db.ForeignKey("team.id"))
+    team_id = db.Column(db.Integer, db.ForeignKey("team.id"), index=True)
 
     submissions = db.relationship("Submission", backref="user", lazy=True)
     feedbacks = db.relationship("Feedback", backref="user", lazy=True)
@@ -74,7 +158,10 @@ class Submission(db.Model):
     github = db.Column(db.String(255), nullable=False)
     video = db.Column(db.String(255), nullable=False)
 
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    # one submission per user
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("user.id"), nullable=False, unique=True, index=True
+    )
 
 
 class Feedback(db.Model):
@@ -82,7 +169,7 @@ class Feedback(db.Model):
     text = db.Column(db.Text, nullable=False)
     rating = db.Column(db.String(10), nullable=False)
 
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), index=True)
 
 
 class Sponsor(db.Model):
@@ -107,27 +194,210 @@ class Notification(db.Model):
 # ------------------------------------------------
 def generate_invite_code():
     """Generate a random 6-char invite code."""
-    chars = string.ascii_uppercase + string.digits
-    return "".join(random.choice(chars) for _ in range(6))
+    # One CSPRNG draw covering all 36^6 codes, then spell it in base 36
+    n = secrets.randbelow(INVITE_CODE_SPACE)
+    code = []
+    for _ in range(INVITE_CODE_LENGTH):
+        n, i = divmod(n, len(INVITE_ALPHABET))
+        code.append(INVITE_ALPHABET[i])
+    return "".join(code)
 
 
-def get_current_user():
-    """Return logged-in user object or None."""
-    if "user_id" in session:
-        return User.query.get(session["user_id"])
-    return None
+def get_current_user(*options):
+    """Return logged-in user object or None.
+
+    Optional loader options (e.g. joinedload) are applied to the lookup.
+    The user is loaded at most once per request and kept on flask.g, so
+    options only take effect on the first call of a request.
+    """
+    if "user_id" not in session:
+        return None
+    if not hasattr(g, "_current_user"):
+        g._current_user = db.session.get(User, session["user_id"], options=options)
+    return g._current_user
+
+
+def init_db():
+    """Create missing tables and indexes, then seed default sponsors."""
+    db.create_all()  # create tables if not exist
+    # create_all() skips existing tables, so bring their indexes up to date:
+    # add missing ones and rebuild any whose UNIQUE flag has changed
+    inspector = inspect(db.engine)
+    for table in db.metadata.tables.values():
+        existing = {ix["name"]: ix for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            found = existing.get(index.name)
+            if found is not None and bool(found["unique"]) == bool(index.unique):
+                continue
+            if index.unique:
+                check_no_duplicates(index)
+            if found is not None:
+                index.drop(db.engine)
+            index.create(db.engine)
+    seed_sponsors()  # default sponsors, seeded once at startup
+
+
+def check_no_duplicates(index):
+    """Raise a readable error if existing rows would violate a UNIQUE index."""
+    columns = list(index.columns)
+    duplicates = db.session.execute(
+        select(*columns).group_by(*columns).having(func.count() > 1).limit(5)
+    ).all()
+    if duplicates:
+        names = ", ".join(c.name for c in columns)
+        values = ", ".join(str(tuple(row)) for row in duplicates)
+        raise RuntimeError(
+            f"Cannot create unique index {index.name}: table "
+            f"{index.table.name} has duplicate ({names}) values, e.g. {values}. "
+            "Remove the duplicate rows and restart."
+        )
 
 
 def seed_sponsors():
     """Insert some default sponsors if table is empty."""
     if Sponsor.query.count() == 0:
-        sponsors = [
-            Sponsor(name="Alpha Tech Solutions", tier="Gold", link="https://example.com"),
-            Sponsor(name="Beta Cloud Services", tier="Silver", link="https://example.com"),
-            Sponsor(name="CodeCraft Academy", tier="Bronze", link="https://example.com"),
+        rows = [
+            {"name": "Alpha Tech Solutions", "tier": "Gold", "link": "https://example.com"},
+            {"name": "Beta Cloud Services", "tier": "Silver", "link": "https://example.com"},
+            {"name": "CodeCraft Academy", "tier": "Bronze", "link": "https://example.com"},
         ]
-        db.session.add_all(sponsors)
+        # Single executemany INSERT, no ORM objects
+        db.session.execute(Sponsor.__table__.insert(), rows)
         db.session.commit()
+        invalidate_cache("sponsors", views=["view//sponsors"])
+
+
+def cache_get_or_set(key, ttl, loader):
+    """
+    Return JSON data cached under `key`, calling `loader()` on a miss.
+    If Redis is unavailable we simply fall back to the database.
+    """
+    try:
+        cached = rc.get(key)
+        if cached is not None:
+            return json.loads(cached)
+    except redis.RedisError:
+        return loader()
+
+    value = loader()
+    try:
+        rc.setex(key, ttl, json.dumps(value))
+    except redis.RedisError:
+        pass
+    return value
+
+
+def invalidate_cache(*keys, views=()):
+    """Drop cached keys (and any cached pages in `views`) after an admin change."""
+    # Guard each backend separately: the page cache may not be Redis at all,
+    # and must still be cleared when the data cache's Redis is unreachable
+    try:
+        rc.delete(*keys)
+    except redis.RedisError:
+        pass
+    if views:
+        try:
+            cache.delete_many(*views)
+        except redis.RedisError:
+            pass
+
+
+def load_home_stats():
+    # SELECT (SELECT COUNT(*) FROM user), (... team), (... submission)
+    # in a single round-trip
+    total_users, total_teams, total_submissions = db.session.execute(
+        select(
+            *(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in (User, Team, Submission)
+            )
+        )
+    ).one()
+    return {
+        "total_users": total_users,
+        "total_teams": total_teams,
+        "total_submissions": total_submissions,
+    }
+
+
+def load_sponsors():
+    return [
+        {"id": s.id, "name": s.name, "tier": s.tier, "link": s.link}
+        for s in Sponsor.query.all()
+    ]
+
+
+def load_live_updates():
+    return [
+        {"id": u.id, "text": u.text}
+        for u in LiveUpdate.query.order_by(LiveUpdate.id.desc()).all()
+    ]
+
+
+def load_notifications():
+    return [
+        {"id": n.id, "text": n.text}
+        for n in Notification.query.order_by(Notification.id.desc()).all()
+    ]
+
+
+def leaderboard_query():
+    """Submissions ranked by id, with only the columns the leaderboard shows."""
+    return (
+        db.session.query(
+            Submission.id,
+            Submission.title,
+            User.name.label("member"),
+            Team.team_name,
+        )
+        .join(User, Submission.user_id == User.id)
+        .outerjoin(Team, User.team_id == Team.id)
+        .order_by(Submission.id.asc())
+    )
+
+
+def verify_password(user, password):
+    """
+    Check `password` against the user's stored hash.
+    Older accounts have Werkzeug (scrypt/pbkdf2) hashes; those are
+    upgraded to Argon2id on a successful login.
+    """
+    if not user.password_hash.startswith("$argon2"):
+        if not check_password_hash(user.password_hash, password):
+            return False
+        user.password_hash = ph.hash(password)
+        db.session.commit()
+        return True
+
+    try:
+        ph.verify(user.password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+    if ph.check_needs_rehash(user.password_hash):
+        user.password_hash = ph.hash(password)
+        db.session.commit()
+    return True
+
+
+def check_admin_credentials(email, password):
+    """Constant-time email compare plus hash check for the admin login."""
+    email_ok = hmac.compare_digest((email or "").encode(), ADMIN_EMAIL.encode())
+    try:
+        password_ok = ph.verify(ADMIN_PASSWORD_HASH, password or "")
+    except (VerificationError, InvalidHashError):
+        password_ok = False
+    return email_ok and password_ok
+
+
+def stream_rows(stmt):
+    """
+    Lazily yield ORM objects for `stmt`, ADMIN_STREAM_BATCH rows at a time.
+    The query runs when the streamed template first iterates the rows.
+    """
+    yield from db.session.scalars(
+        stmt.execution_options(yield_per=ADMIN_STREAM_BATCH)
+    )
 
 
 def require_admin():
@@ -143,6 +413,7 @@ def require_admin():
 # ------------------------------------------------
 
 @app.route("/")
+@cache.cached(timeout=STATS_TTL)
 def home():
     """
     Landing page:
@@ -150,18 +421,18 @@ def home():
     - Shows live snapshot (participants, teams, submissions)
     - Shows mini top-3 leaderboard preview
     """
-    total_users = User.query.count()
-    total_teams = Team.query.count()
-    total_submissions = Submission.query.count()
+    # The whole page is cached for STATS_TTL, so the counts are read
+    # straight from the DB here rather than through a second cache layer
+    stats = load_home_stats()
 
     # Top 3 earliest submissions
-    top_submissions = Submission.query.order_by(Submission.id.asc()).limit(3).all()
+    top_submissions = leaderboard_query().limit(3).all()
 
     return render_template(
         "index.html",
-        total_users=total_users,
-        total_teams=total_teams,
-        total_submissions=total_submissions,
+        total_users=stats["total_users"],
+        total_teams=stats["total_teams"],
+        total_submissions=stats["total_submissions"],
         top_submissions=top_submissions,
     )
 
@@ -179,13 +450,16 @@ def register():
         team_name = request.form.get("teamName")
         invite_code = request.form.get("inviteCode")
 
-        # Check if email is already used
-        if User.query.filter_by(email=email).first():
+        # Check if email is already used (SELECT EXISTS, no row loaded)
+        email_taken = db.session.query(
+            db.session.query(User.id).filter_by(email=email).exists()
+        ).scalar()
+        if email_taken:
             flash("Email already registered. Please login.", "error")
             return redirect(url_for("login"))
 
         # Create user
-        password_hash = generate_password_hash(password)
+        password_hash = ph.hash(password)
         user = User(
             name=name,
             email=email,
@@ -200,26 +474,32 @@ def register():
             if not team_name:
                 team_name = f"Team-{name.split()[0]}"
 
-            code = generate_invite_code()
-            # Ensure unique invite code
-            while Team.query.filter_by(invite_code=code).first():
-                code = generate_invite_code()
-
-            new_team = Team(team_name=team_name, invite_code=code)
-            db.session.add(new_team)
-            db.session.flush()  # give new_team.id without committing
-
-            user.team_id = new_team.id
+            # Inserted together with the user on commit; the FK is
+            # resolved through the relationship, no flush needed
+            new_team = Team(team_name=team_name)
+            user.team = new_team
 
         elif team_choice == "join":
-            team = Team.query.filter_by(invite_code=invite_code).first()
-            if not team:
+            team_id = db.session.query(Team.id).filter_by(invite_code=invite_code).scalar()
+            if team_id is None:
                 flash("Invalid invite code!", "error")
                 return redirect(url_for("register"))
-            user.team_id = team.id
-
-        db.session.add(user)
-        db.session.commit()
+            user.team_id = team_id
+
+        # invite_code is UNIQUE, so let the DB catch the rare collision
+        attempts = 5 if team_choice == "create" else 1
+        for _ in range(attempts):
+            if team_choice == "create":
+                new_team.invite_code = generate_invite_code()
+            db.session.add(user)
+            try:
+                db.session.commit()
+                break
+            except IntegrityError:
+                db.session.rollback()
+        else:
+            flash("Could not complete registration, please try again.", "error")
+            return redirect(url_for("register"))
 
         flash("Registration successful. Please login.", "success")
         return redirect(url_for("login"))
@@ -236,7 +516,7 @@ def login():
 
         user = User.query.filter_by(email=email).first()
 
-        if user and check_password_hash(user.password_hash, password):
+        if user and verify_password(user, password):
             session["user_id"] = user.id
             flash("Logged in successfully!", "success")
             return redirect(url_for("dashboard"))
@@ -257,20 +537,22 @@ def logout():
 # ---------- DASHBOARD ----------
 @app.route("/dashboard")
 def dashboard():
-    user = get_current_user()
+    # Load team, team members and submissions together with the user
+    user = get_current_user(
+        joinedload(User.team).selectinload(Team.members),
+        selectinload(User.submissions),
+    )
     if not user:
         flash("Please login to access dashboard.", "error")
         return redirect(url_for("login"))
 
     team = user.team
-    team_members = User.query.filter_by(team_id=team.id).all() if team else []
-    submission = Submission.query.filter_by(user_id=user.id).first()
+    team_members = team.members if team else []
+    submission = user.submissions[0] if user.submissions else None
 
-    seed_sponsors()
-    sponsors = Sponsor.query.all()
-
-    live_updates = LiveUpdate.query.order_by(LiveUpdate.id.desc()).all()
-    notifications = Notification.query.order_by(Notification.id.desc()).all()
+    sponsors = cache_get_or_set("sponsors", SPONSORS_TTL, load_sponsors)
+    live_updates = cache_get_or_set("live_updates", UPDATES_TTL, load_live_updates)
+    notifications = cache_get_or_set("notifications", UPDATES_TTL, load_notifications)
 
     return render_template(
         "dashboard.html",
@@ -298,23 +580,24 @@ def submit():
         github = request.form.get("github")
         video = request.form.get("video")
 
-        sub = Submission.query.filter_by(user_id=user.id).first()
-
-        if not sub:
-            sub = Submission(
-                title=title,
-                description=desc,
-                github=github,
-                video=video,
-                user_id=user.id,
-            )
-            db.session.add(sub)
-        else:
-            sub.title = title
-            sub.description = desc
-            sub.github = github
-            sub.video = video
-
+        # Insert or update the user's submission in one statement
+        stmt = sqlite_insert(Submission).values(
+            title=title,
+            description=desc,
+            github=github,
+            video=video,
+            user_id=user.id,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "title": stmt.excluded.title,
+                "description": stmt.excluded.description,
+                "github": stmt.excluded.github,
+                "video": stmt.excluded.video,
+            },
+        )
+        db.session.execute(stmt)
         db.session.commit()
         flash("Submission saved!", "success")
         return redirect(url_for("dashboard"))
@@ -352,14 +635,15 @@ def feedback():
 
 # ---------- SPONSORS ----------
 @app.route("/sponsors")
+@cache.cached(timeout=3600)
 def sponsors_page():
-    seed_sponsors()
-    sponsors = Sponsor.query.all()
+    sponsors = cache_get_or_set("sponsors", SPONSORS_TTL, load_sponsors)
     return render_template("sponsors.html", sponsors=sponsors)
 
 
 # ---------- FAQ ----------
 @app.route("/faq")
+@cache.cached(timeout=300)
 def faq():
     return render_template("faq.html")
 
@@ -370,9 +654,22 @@ def leaderboard():
     """
     Simple leaderboard:
     - Rank by earliest submission (smallest id first)
+    - Paginated, LEADERBOARD_PER_PAGE rows per page
     """
-    submissions = Submission.query.order_by(Submission.id.asc()).all()
-    return render_template("leaderboard.html", submissions=submissions)
+    page = max(request.args.get("page", 1, type=int), 1)
+    offset = (page - 1) * LEADERBOARD_PER_PAGE
+
+    # Fetch one extra row to know whether there is a next page
+    rows = leaderboard_query().limit(LEADERBOARD_PER_PAGE + 1).offset(offset).all()
+    has_next = len(rows) > LEADERBOARD_PER_PAGE
+
+    return render_template(
+        "leaderboard.html",
+        submissions=rows[:LEADERBOARD_PER_PAGE],
+        page=page,
+        offset=offset,
+        has_next=has_next,
+    )
 
 
 # ------------------------------------------------
@@ -381,15 +678,11 @@ def leaderboard():
 
 @app.route("/admin/login", methods=["GET", "POST"])
 def admin_login():
-    # Hard-coded admin credentials
-    ADMIN_EMAIL = "admin@hackathon.com"
-    ADMIN_PASSWORD = "admin123"
-
     if request.method == "POST":
         email = request.form.get("email")
         password = request.form.get("password")
 
-        if email == ADMIN_EMAIL and password == ADMIN_PASSWORD:
+        if check_admin_credentials(email, password):
             session["is_admin"] = True
             flash("Admin login successful!", "success")
             return redirect(url_for("admin_dashboard"))
@@ -411,10 +704,11 @@ def admin_dashboard():
     if not require_admin():
         return redirect(url_for("admin_login"))
 
-    updates = LiveUpdate.query.order_by(LiveUpdate.id.desc()).all()
-    notifications = Notification.query.order_by(Notification.id.desc()).all()
+    # Stream rows in batches instead of building full lists up front
+    updates = stream_rows(select(LiveUpdate).order_by(LiveUpdate.id.desc()))
+    notifications = stream_rows(select(Notification).order_by(Notification.id.desc()))
 
-    return render_template(
+    return stream_template(
         "admin_dashboard.html",
         updates=updates,
         notifications=notifications,
@@ -430,6 +724,7 @@ def admin_add_update():
     if text:
         db.session.add(LiveUpdate(text=text))
         db.session.commit()
+        invalidate_cache("live_updates")
 
     return redirect(url_for("admin_dashboard"))
 
@@ -443,30 +738,37 @@ def admin_add_notification():
     if text:
         db.session.add(Notification(text=text))
         db.session.commit()
+        invalidate_cache("notifications")
 
     return redirect(url_for("admin_dashboard"))
 
 
-@app.route("/admin/delete_update/<int:id>")
+@app.route("/admin/delete_update/<int:id>", methods=["POST"])
 def admin_delete_update(id):
     if not require_admin():
         return redirect(url_for("admin_login"))
 
-    item = LiveUpdate.query.get_or_404(id)
-    db.session.delete(item)
+    # Single DELETE, no SELECT first
+    result = db.session.execute(delete(LiveUpdate).where(LiveUpdate.id == id))
     db.session.commit()
+    if result.rowcount == 0:
+        abort(404)
+    invalidate_cache("live_updates")
 
     return redirect(url_for("admin_dashboard"))
 
 
-@app.route("/admin/delete_notification/<int:id>")
+@app.route("/admin/delete_notification/<int:id>", methods=["POST"])
 def admin_delete_notification(id):
     if not require_admin():
         return redirect(url_for("admin_login"))
 
-    item = Notification.query.get_or_404(id)
-    db.session.delete(item)
+    # Single DELETE, no SELECT first
+    result = db.session.execute(delete(Notification).where(Notification.id == id))
     db.session.commit()
+    if result.rowcount == 0:
+        abort(404)
+    invalidate_cache("notifications")
 
     return redirect(url_for("admin_dashboard"))
 
@@ -476,14 +778,20 @@ def admin_teams():
     if not require_admin():
         return redirect(url_for("admin_login"))
 
-    teams = Team.query.all()
-    return render_template("admin_teams.html", teams=teams)
+    # Members are selectin-loaded per batch, not one query per team
+    teams = stream_rows(select(Team).options(selectinload(Team.members)))
+    return stream_template("admin_teams.html", teams=teams)
+
+
+# ------------------------------------------------
+# DATABASE SETUP (runs on import, so gunicorn app:app gets it too)
+# ------------------------------------------------
+with app.app_context():
+    init_db()
 
 
 # ------------------------------------------------
 # MAIN ENTRY
 # ------------------------------------------------
 if __name__ == "__main__":
-    with app.app_context():
-        db.create_all()  # create tables if not exist
     app.run(debug=True)